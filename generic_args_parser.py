@@ -1,6 +1,7 @@
 """Parsing module for the project."""
 
 import argparse
+import os
 import time
 
 import serial
@@ -41,31 +42,38 @@ def parse_args() -> dict:
     args = parser.parse_args()
 
     port = args.port
-    current_ports = list(comport.device for comport in comports())
 
-    if port not in current_ports:
-        if len(current_ports) == 0:
-            message = (
-                "Currently no serial device is connected "
-                "(check your connections)."
-            )
+    # Listing the serial ports is only needed when the port is not an
+    # existing device node (e.g., a COM port on Windows or a typo)
+    if not os.path.exists(port):
+        current_ports = list(comport.device for comport in comports())
 
-        elif len(current_ports) == 1:
-            message = (
-                "Currently only one serial port is available: " f"{current_ports[0]}."
-            )
+        if port not in current_ports:
+            if len(current_ports) == 0:
+                message = (
+                    "Currently no serial device is connected "
+                    "(check your connections)."
+                )
 
-        else:
-            separator = "\n\t- "
+            elif len(current_ports) == 1:
+                message = (
+                    "Currently only one serial port is available: "
+                    f"{current_ports[0]}."
+                )
 
-            message = (
-                f"Currently {len(current_ports)} serial ports are available:\n\n"
-                f"\t- {(separator).join(current_ports)}"
-            )
+            else:
+                separator = "\n\t- "
+
+                message = (
+                    f"Currently {len(current_ports)} serial ports are available:\n\n"
+                    f"\t- {(separator).join(current_ports)}"
+                )
 
-        raise ValueError(f'"{port}" is not a valid port.\n{message}')
+            raise ValueError(f'"{port}" is not a valid port.\n{message}')
 
     number_of_tries = 5
+    retry_delay = 0.25  # in seconds, doubled after each failed try
+    version = None
 
     with serial.Serial(
         port=port,
@@ -76,16 +84,16 @@ def parse_args() -> dict:
         timeout=1,
     ) as serial_port:
         while number_of_tries > 0:
-            try:
-                version = read_firmware_version(serial_port, verbose=False)
+            version = read_firmware_version(serial_port, verbose=False)
 
-                if version is not None and version != "V0.0.0":
-                    break
+            if version is not None and version != "V0.0.0":
+                break
 
-                time.sleep(0.5)
+            number_of_tries -= 1
 
-            finally:
-                number_of_tries -= 1
+            if number_of_tries > 0:
+                time.sleep(retry_delay)
+                retry_delay *= 2
 
         if version is None or version == "V0.0.0":
             raise ConnectionError(
@@ -1,86 +1,205 @@
 """A script to plot the LD2450 sensor readings."""
 
-import queue
-import threading
+import multiprocessing
+import signal
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event
 
 import matplotlib.pyplot as plt
+import numpy as np
 import serial
-from matplotlib.animation import FuncAnimation
 
 import serial_protocol
 
+# Frames are latest-wins telemetry, older ones are overwritten once the ring
+# of shared slots is full
+FRAME_SLOTS = 4
+FRAME_SLOT_SIZE = 32
 
-def serial_reader(port: str, baudrate: int, data_queue):
-    """Put the serial port data in a queue."""
-    with serial.Serial(port, baudrate, timeout=1) as ser:
+# Delay between two plot updates (in ms)
+UPDATE_INTERVAL = 100
+
+# Delay given to the serial reader process to stop on its own (in s)
+READER_STOP_TIMEOUT = 2
+
+
+class BlitManager:
+    """Redraw the animated artists of an axes on top of a cached background."""
+
+    def __init__(self, ax, animated_artists=()):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self._background = None
+        self._artists = []
+
+        for artist in animated_artists:
+            self.add_artist(artist)
+
+        # The background must be grabbed again whenever the figure is redrawn
+        # (e.g., the first time it is shown or when the window is resized)
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+    def add_artist(self, artist):
+        """Add an artist to redraw on each update."""
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+    def on_draw(self, _):
+        """Cache the axes background and draw the animated artists on it."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._artists:
+            self.ax.draw_artist(artist)
+
+    def update(self):
+        """Restore the background, redraw the artists and blit the axes."""
+        if self._background is None:
+            # The figure has not been drawn yet, nothing to restore
+            return
+
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
+        self.canvas.flush_events()
+
+
+class SharedFrames:
+    """Ring of the latest report frames, shared between processes."""
+
+    def __init__(self, slots: int = FRAME_SLOTS):
+        self.slots = slots
+        self.memory = SharedMemory(create=True, size=FRAME_SLOT_SIZE * slots)
+
+        # Number of frames written so far, there is a single writer
+        self.write_index = multiprocessing.Value("Q", 0, lock=False)
+        self.read_index = 0
+        self.last_frame = None
+
+    def put(self, frame: bytes):
+        """Write a frame in the next slot, overwriting the oldest one."""
+        index = self.write_index.value
+        start = (index % self.slots) * FRAME_SLOT_SIZE
+
+        self.memory.buf[start:start + len(frame)] = frame
+        self.write_index.value = index + 1
+
+    def get_new(self) -> list[bytes]:
+        """
+        Return the frames written since the last call, most recent first.
+
+        Nothing is returned if the most recent frame is the same as the one
+        returned last (e.g., in a static scene), there is nothing to update.
+        """
+        write_index = self.write_index.value
 
-        while True:
-            data = ser.read_until(serial_protocol.REPORT_TAIL)
-            data_queue.put(data)
+        # The slot after the most recent frame is the next one to be written
+        first_index = max(self.read_index, write_index - self.slots + 1)
+        self.read_index = write_index
 
+        frames = []
 
-def update_plot(_, scater_plot, data_queue):
-    """Update the plot with"""
+        for index in range(write_index - 1, first_index - 1, -1):
+            start = (index % self.slots) * FRAME_SLOT_SIZE
+            frames.append(
+                bytes(
+                    self.memory.buf[
+                        start:start + serial_protocol.REPORT_FRAME_LENGTH]
+                )
+            )
 
-    # Check if there is data in the queue
-    while not data_queue.empty():
-        serial_protocol_line = data_queue.get()
+        # The writer does not lock the slots and may have moved on while the
+        # frames were copied. Check the index again (like a seqlock) and drop
+        # the frames whose slot may have been overwritten meanwhile.
+        oldest_valid_index = self.write_index.value - self.slots + 1
+        del frames[max(0, write_index - oldest_valid_index):]
 
-        # Check if the frame header and tail are present
-        if (
-            serial_protocol.REPORT_HEADER in serial_protocol_line
-            and serial_protocol.REPORT_TAIL in serial_protocol_line
-        ):
-            # Extract the target values
-            all_target_values = serial_protocol.read_radar_data(
-                serial_protocol_line)
+        if not frames or frames[0] == self.last_frame:
+            return []
 
-            if all_target_values is None:
-                continue
+        self.last_frame = frames[0]
 
-            (
-                target1_x,
-                target1_y,
-                _,  # target1_speed,
-                _,  # target1_distance_res,
-                target2_x,
-                target2_y,
-                _,  # target2_speed,
-                _,  # target2_distance_res,
-                target3_x,
-                target3_y,
-                _,  # target3_speed,
-                _,  # target3_distance_res,
-            ) = all_target_values
+        return frames
+
+    def close(self):
+        """Release the shared memory."""
+        self.memory.close()
+        self.memory.unlink()
 
-            # current targets
-            current_targets_x = [target1_x, target2_x, target3_x]
-            current_targets_y = [target1_y, target2_y, target3_y]
 
-            # Update target lists with current targets --> all timesteps are stored
-            # targets_x.extend(current_targets_x)
-            # targets_y.extend(current_targets_y)
+def _exit_on_signal(*_):
+    """Exit the process, unwinding it (unlike the default SIGTERM action)."""
+    raise SystemExit()
 
-            # Update the scatter plot
-            scater_plot.set_offsets(
-                list(zip(current_targets_x, current_targets_y)))
 
-    return (scater_plot,)
+def serial_reader(
+    port: str,
+    baudrate: int,
+    shared_frames: SharedFrames,
+    stop_event: Event,
+):
+    """Put the serial port data in the shared frames until stop_event is set."""
+    # Ctrl+C also reaches this process, the main process stops it instead
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # Leave the with blocks when terminated, so the port settings are restored
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+
+    with serial.Serial(port, baudrate, timeout=1) as ser:
+        with serial_protocol.report_frames(ser) as frames:
+            for data in frames:
+                if stop_event.is_set():
+                    break
+
+                shared_frames.put(data)
+
+
+def update_plot(scater_plot, shared_frames: SharedFrames, blit_manager):
+    """Update the plot with the most recent targets."""
+    # Extract the target values of the most recent valid frame
+    all_target_values = None
+
+    for serial_protocol_line in shared_frames.get_new():
+        all_target_values = serial_protocol.read_radar_data(
+            serial_protocol_line)
+
+        if all_target_values is not None:
+            break
+
+    if all_target_values is None:
+        return
+
+    # current targets, each row holds the x, y, speed and distance resolution
+    # of a target, only x and y are plotted
+    current_targets = np.reshape(all_target_values, (3, 4))[:, :2]
+
+    # Update the scatter plot
+    scater_plot.set_offsets(current_targets)
+
+    blit_manager.update()
 
 
 def draw_and_update(port: str, baudrate: int):
     """Start the main routine and draw the first plot."""
-    # Create a thread-safe queue to communicate between threads
-    data_queue = queue.Queue()
+    # Create the shared memory to communicate between processes
+    shared_frames = SharedFrames()
+    stop_event = multiprocessing.Event()
 
-    # Create and start the serial reader thread
-    serial_thread = threading.Thread(
+    # Create and start the serial reader process (it does not compete with
+    # the plot for the GIL)
+    serial_process = multiprocessing.Process(
         target=serial_reader,
-        kwargs={"port": port, "baudrate": baudrate, "data_queue": data_queue},
+        kwargs={
+            "port": port,
+            "baudrate": baudrate,
+            "shared_frames": shared_frames,
+            "stop_event": stop_event,
+        },
     )
 
-    serial_thread.daemon = True
-    serial_thread.start()
+    serial_process.daemon = True
+    serial_process.start()
 
     # Initialize empty lists to store all target information
     targets_x = []
@@ -95,16 +214,31 @@ def draw_and_update(port: str, baudrate: int):
     ax.set_xlim(-1000, 1000)
     ax.set_ylim(-6000, 0)
 
-    # Create an animation
-    _ = FuncAnimation(
-        fig, update_plot, fargs=(sc, data_queue), blit=True, cache_frame_data=False
-    )
-
     plt.xlabel("x [mm]")
     plt.ylabel("y [mm]")
 
     plt.grid()
-    plt.show()
+
+    # Only redraw the targets, the rest of the axes is restored from a cache
+    blit_manager = BlitManager(ax, animated_artists=(sc,))
+
+    timer = fig.canvas.new_timer(interval=UPDATE_INTERVAL)
+    timer.add_callback(update_plot, sc, shared_frames, blit_manager)
+    timer.start()
+
+    try:
+        plt.show()
+
+    finally:
+        stop_event.set()
+        serial_process.join(READER_STOP_TIMEOUT)
+
+        if serial_process.is_alive():
+            # No frame was received to notice the stop event
+            serial_process.terminate()
+            serial_process.join()
+
+        shared_frames.close()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,28 @@
 """A script to print the information extracted from the LD2450."""
 
+import sys
+
 import serial
 
 import serial_protocol
 
+# Report of the interpreted information for all targets
+_format_targets = (
+    "Target 1 x-coordinate: {} mm\n"
+    "Target 1 y-coordinate: {} mm\n"
+    "Target 1 speed: {} cm/s\n"
+    "Target 1 distance res: {} mm\n\n"
+    "Target 2 x-coordinate: {} mm\n"
+    "Target 2 y-coordinate: {} mm\n"
+    "Target 2 speed: {} cm/s\n"
+    "Target 2 distance res: {} mm\n\n"
+    "Target 3 x-coordinate: {} mm\n"
+    "Target 3 y-coordinate: {} mm\n"
+    "Target 3 speed: {} cm/s\n"
+    "Target 3 distance res: {} mm\n"
+    + "-" * 30 + "\n"
+).format
+
 
 def print_targets(port: str, baudrate: int, continuous: bool = True):
     """Print the information extracted from the LD2450.
@@ -16,32 +35,28 @@ def print_targets(port: str, baudrate: int, continuous: bool = True):
     try:
         # Open the serial port
         with serial.Serial(port, baudrate, timeout=1) as ser:
-            while continuous:
-                all_target_values = serial_protocol.read_radar_data(
-                    # Read a line from the serial port
-                    ser.read_until(serial_protocol.REPORT_TAIL)
-                )
-
-                if all_target_values is None:
-                    continue
-
-                # Print the interpreted information for all targets
-                print(
-                    f"Target 1 x-coordinate: {all_target_values[0]} mm\n"
-                    f"Target 1 y-coordinate: {all_target_values[1]} mm\n"
-                    f"Target 1 speed: {all_target_values[2]} cm/s\n"
-                    f"Target 1 distance res: {all_target_values[3]} mm\n\n"
-                    f"Target 2 x-coordinate: {all_target_values[4]} mm\n"
-                    f"Target 2 y-coordinate: {all_target_values[5]} mm\n"
-                    f"Target 2 speed: {all_target_values[6]} cm/s\n"
-                    f"Target 2 distance res: {all_target_values[7]} mm\n\n"
-                    f"Target 3 x-coordinate: {all_target_values[8]} mm\n"
-                    f"Target 3 y-coordinate: {all_target_values[9]} mm\n"
-                    f"Target 3 speed: {all_target_values[10]} cm/s\n"
-                    f"Target 3 distance res: {all_target_values[11]} mm"
-                )
-
-                print("-" * 30)
+            with serial_protocol.report_frames(ser) as frames:
+                last_serial_port_line = None
+
+                while continuous:
+                    # Read a frame from the serial port
+                    serial_port_line = next(frames)
+
+                    # Skip the frames repeating the last one (static scene)
+                    if serial_port_line == last_serial_port_line:
+                        continue
+
+                    # The frame is read in place, keep a copy to compare with
+                    last_serial_port_line = bytes(serial_port_line)
+
+                    all_target_values = serial_protocol.read_radar_data(
+                        serial_port_line)
+
+                    if all_target_values is None:
+                        continue
+
+                    # Print the interpreted information for all targets
+                    sys.stdout.write(_format_targets(*all_target_values))
 
     except KeyboardInterrupt:
         print("Serial port closed.")
@@ -1,15 +1,134 @@
 """A driver module to communicate with the LD2450."""
 
+import io
+import os
+import select
+import struct
+import warnings
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
 import serial
 
+try:
+    import termios
+
+except ImportError:  # Not available on Windows
+    termios = None
+
 COMMAND_HEADER = bytes.fromhex("FD FC FB FA")
 COMMAND_TAIL = bytes.fromhex("04 03 02 01")
 
 REPORT_HEADER = bytes.fromhex("AA FF 03 00")
 REPORT_TAIL = bytes.fromhex("55 CC")
+REPORT_FRAME_LENGTH = 30
+
+# Maximum number of bytes read from the serial port at once
+READ_CHUNK_SIZE = 4096
 
 BYTES_FROM_HEX_EMPTY = bytes.fromhex("")
 
+# Intra frame lengths (command word + command value)
+INTRA_FRAME_LENGTH_2 = int(2).to_bytes(2, byteorder="little", signed=False)
+INTRA_FRAME_LENGTH_4 = int(4).to_bytes(2, byteorder="little", signed=False)
+INTRA_FRAME_LENGTH_26 = int(26).to_bytes(2, byteorder="little", signed=False)
+
+# Command words (see docs 2.2)
+ENABLE_CONFIGURATION_COMMAND = bytes.fromhex("FF 00")
+END_CONFIGURATION_COMMAND = bytes.fromhex("FE 00")
+SINGLE_TARGET_TRACKING_COMMAND = bytes.fromhex("80 00")
+MULTI_TARGET_TRACKING_COMMAND = bytes.fromhex("90 00")
+QUERY_TARGET_TRACKING_COMMAND = bytes.fromhex("91 00")
+READ_FIRMWARE_VERSION_COMMAND = bytes.fromhex("A0 00")
+SET_SERIAL_PORT_BAUD_RATE_COMMAND = bytes.fromhex("A1 00")
+RESTORE_FACTORY_SETTINGS_COMMAND = bytes.fromhex("A2 00")
+RESTART_MODULE_COMMAND = bytes.fromhex("A3 00")
+BLUETOOTH_SETUP_COMMAND = bytes.fromhex("A4 00")
+GET_MAC_ADDRESS_COMMAND = bytes.fromhex("A5 00")
+QUERY_ZONE_FILTERING_COMMAND = bytes.fromhex("C1 00")
+SET_ZONE_FILTERING_COMMAND = bytes.fromhex("C2 00")
+
+# Command values
+COMMAND_VALUE_ON = bytes.fromhex("01 00")
+COMMAND_VALUE_OFF = bytes.fromhex("00 00")
+
+# Parameter of the get MAC address command (see docs 2.2.11)
+GET_MAC_ADDRESS_VALUE = bytes.fromhex("01 00")
+
+
+def _command_frame(
+    intra_frame_length: bytes,
+    command_word: bytes,
+    command_value: bytes = BYTES_FROM_HEX_EMPTY,
+) -> bytes:
+    """Build a command frame, header and tail included (see docs 2.1.2)."""
+    return b"".join(
+        (
+            COMMAND_HEADER,
+            intra_frame_length,
+            command_word,
+            command_value,
+            COMMAND_TAIL,
+        )
+    )
+
+
+# Complete frames of the commands with a fixed command value
+ENABLE_CONFIGURATION_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_4, ENABLE_CONFIGURATION_COMMAND, COMMAND_VALUE_ON
+)
+END_CONFIGURATION_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_2, END_CONFIGURATION_COMMAND
+)
+SINGLE_TARGET_TRACKING_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_2, SINGLE_TARGET_TRACKING_COMMAND
+)
+MULTI_TARGET_TRACKING_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_2, MULTI_TARGET_TRACKING_COMMAND
+)
+QUERY_TARGET_TRACKING_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_2, QUERY_TARGET_TRACKING_COMMAND
+)
+READ_FIRMWARE_VERSION_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_2, READ_FIRMWARE_VERSION_COMMAND
+)
+RESTORE_FACTORY_SETTINGS_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_2, RESTORE_FACTORY_SETTINGS_COMMAND
+)
+RESTART_MODULE_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_2, RESTART_MODULE_COMMAND
+)
+GET_MAC_ADDRESS_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_4, GET_MAC_ADDRESS_COMMAND, GET_MAC_ADDRESS_VALUE
+)
+QUERY_ZONE_FILTERING_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_2, QUERY_ZONE_FILTERING_COMMAND
+)
+BLUETOOTH_ON_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_4, BLUETOOTH_SETUP_COMMAND, COMMAND_VALUE_ON
+)
+BLUETOOTH_OFF_FRAME = _command_frame(
+    INTRA_FRAME_LENGTH_4, BLUETOOTH_SETUP_COMMAND, COMMAND_VALUE_OFF
+)
+
+# x, y, speed (sign-magnitude) and distance resolution of the three targets
+_RADAR_DATA_STRUCT = struct.Struct("<12H")
+
+# Zone filtering mode and diagonal vertices coordinates of the three regions
+_ZONE_FILTERING_STRUCT = struct.Struct("<13h")
+
+# Firmware type, major and minor version numbers
+_FIRMWARE_VERSION_STRUCT = struct.Struct("<hhi")
+
+# Minimum response lengths (the values start after the header, length,
+# command word and ACK status)
+_FIRMWARE_VERSION_LENGTH = 10 + _FIRMWARE_VERSION_STRUCT.size
+_ZONE_FILTERING_LENGTH = 10 + _ZONE_FILTERING_STRUCT.size
+
+# Sign-magnitude 16-bit fields: value >> SIGN_SHIFT is the sign bit
+SIGN_SHIFT = 15
+MAGNITUDE_MASK = 0x7FFF
+
 POSSIBLE_BAUDRATES = [
     9600,
     19200,
@@ -40,15 +159,22 @@ def send_command(
     Returns:
     - response (bytes, bool): the response from the radar and success (bool)
     """
-    # Create the command
-    command = (
-        COMMAND_HEADER
-        + intra_frame_length
-        + command_word
-        + command_value
-        + COMMAND_TAIL
-    )
+    command = _command_frame(intra_frame_length, command_word, command_value)
+
+    return send_command_frame(ser, command)
+
+
+def send_command_frame(ser: serial.Serial, command: bytes) -> tuple[bytes, bool]:
+    """
+    Send a complete command frame to the radar and return success.
 
+    Parameters:
+    - ser (serial.Serial): the serial port object
+    - command (bytes): the command frame, header and tail included
+
+    Returns:
+    - response (bytes, bool): the response from the radar and success (bool)
+    """
     ser.write(command)
     response = ser.read_until(COMMAND_TAIL)
 
@@ -69,12 +195,7 @@ def enable_configuration_mode(ser: serial.Serial) -> bool:
     - success (bool): True if the configuration mode was successfully enabled,
     False otherwise
     """
-    _, command_success = send_command(
-        ser,
-        intra_frame_length=int(4).to_bytes(2, byteorder="little", signed=True),
-        command_word=bytes.fromhex("FF 00"),
-        command_value=bytes.fromhex("01 00"),
-    )
+    _, command_success = send_command_frame(ser, ENABLE_CONFIGURATION_FRAME)
 
     if command_success:
         print("Configuration mode enabled")
@@ -94,13 +215,7 @@ def end_configuration_mode(ser: serial.Serial) -> bool:
     - success (bool): True if the configuration mode was successfully ended,
     False otherwise
     """
-    _, command_success = send_command(
-        ser,
-        intra_frame_length=int(2).to_bytes(
-            2, byteorder="little", signed=False),
-        command_word=bytes.fromhex("FE 00"),
-        command_value=BYTES_FROM_HEX_EMPTY,
-    )
+    _, command_success = send_command_frame(ser, END_CONFIGURATION_FRAME)
 
     if command_success:
         print("Configuration mode disabled")
@@ -120,12 +235,7 @@ def single_target_tracking(ser: serial.Serial) -> bool:
     - success (bool): True if the single target tracking mode was
     successfully enabled, False otherwise
     """
-    _, command_success = send_command(
-        ser,
-        intra_frame_length=int(2).to_bytes(2, byteorder="little", signed=True),
-        command_word=bytes.fromhex("80 00"),
-        command_value=BYTES_FROM_HEX_EMPTY,
-    )
+    _, command_success = send_command_frame(ser, SINGLE_TARGET_TRACKING_FRAME)
 
     if command_success:
         print("Single target tracking mode enabled")
@@ -145,12 +255,7 @@ def multi_target_tracking(ser: serial.Serial) -> bool:
     - success (bool): True if the multiple target tracking mode was
     successfully enabled, False otherwise
     """
-    _, command_success = send_command(
-        ser,
-        intra_frame_length=int(2).to_bytes(2, byteorder="little", signed=True),
-        command_word=bytes.fromhex("90 00"),
-        command_value=BYTES_FROM_HEX_EMPTY,
-    )
+    _, command_success = send_command_frame(ser, MULTI_TARGET_TRACKING_FRAME)
 
     if command_success:
         print("Multi target tracking mode enabled")
@@ -169,12 +274,7 @@ def query_target_tracking(ser: serial.Serial) -> int:
     Returns:
     - tracking mode (int): 1 for single target tracking, 2 for multi target tracking
     """
-    response, command_success = send_command(
-        ser,
-        intra_frame_length=int(2).to_bytes(2, byteorder="little", signed=True),
-        command_word=bytes.fromhex("91 00"),
-        command_value=BYTES_FROM_HEX_EMPTY,
-    )
+    response, command_success = send_command_frame(ser, QUERY_TARGET_TRACKING_FRAME)
 
     if not command_success:
         print("Query target tracking mode failed")
@@ -195,29 +295,20 @@ def read_firmware_version(ser: serial.Serial, verbose: bool = True) -> str | Non
     Returns:
     - firmware_version (str): the firmware version of the radar
     """
-    response, command_success = send_command(
-        ser,
-        intra_frame_length=int(2).to_bytes(2, byteorder="little", signed=True),
-        command_word=bytes.fromhex("A0 00"),
-        command_value=BYTES_FROM_HEX_EMPTY,
-    )
+    response, command_success = send_command_frame(ser, READ_FIRMWARE_VERSION_FRAME)
 
-    if not command_success:
+    # A truncated response (e.g., on timeout) does not hold the version
+    if not command_success or len(response) < _FIRMWARE_VERSION_LENGTH:
         if verbose:
             print("Failed to read firmware version failed")
 
         return None
 
-    firmware_type = int.from_bytes(
-        response[10:12], byteorder="little", signed=True)
-
-    major_version_number = int.from_bytes(
-        response[12:14], byteorder="little", signed=True
-    )
-
-    minor_version_number = int.from_bytes(
-        response[14:18], byteorder="little", signed=True
-    )
+    (
+        firmware_type,
+        major_version_number,
+        minor_version_number,
+    ) = _FIRMWARE_VERSION_STRUCT.unpack_from(response, 10)
 
     firmware_version = f"V{firmware_type}.{major_version_number}.{minor_version_number}"
 
@@ -246,8 +337,8 @@ def set_serial_port_baud_rate(ser: serial.Serial, baud_rate: int = 256000) -> bo
 
     _, command_success = send_command(
         ser,
-        intra_frame_length=int(4).to_bytes(2, byteorder="little", signed=True),
-        command_word=bytes.fromhex("A1 00"),
+        intra_frame_length=INTRA_FRAME_LENGTH_4,
+        command_word=SET_SERIAL_PORT_BAUD_RATE_COMMAND,
         command_value=baudrate_index.to_bytes(
             2, byteorder="little", signed=False)
     )
@@ -269,13 +360,7 @@ def restore_factory_settings(ser: serial.Serial) -> bool:
     Returns:
     - success (bool): True if the factory settings were successfully restored, False otherwise
     """
-    _, command_success = send_command(
-        ser,
-        intra_frame_length=int(2).to_bytes(
-            2, byteorder="little", signed=False),
-        command_word=bytes.fromhex("A2 00"),
-        command_value=BYTES_FROM_HEX_EMPTY
-    )
+    _, command_success = send_command_frame(ser, RESTORE_FACTORY_SETTINGS_FRAME)
 
     if command_success:
         print("Factory settings restored")
@@ -295,14 +380,7 @@ def restart_module(ser: serial.Serial) -> bool:
     - success (bool): True if the radar module was successfully restarted,
     False otherwise
     """
-    _, command_success = send_command(
-        ser,
-        intra_frame_length=int(2).to_bytes(
-            2, byteorder="little", signed=False),
-        command_word=bytes.fromhex("A3 00"),
-        command_value=BYTES_FROM_HEX_EMPTY
-
-    )
+    _, command_success = send_command_frame(ser, RESTART_MODULE_FRAME)
 
     if command_success:
         print("Module restarted")
@@ -326,13 +404,8 @@ def bluetooth_setup(ser: serial.Serial, bluetooth_on: bool = True) -> bool:
     - success (bool): True if the bluetooth was successfully set up,
     False otherwise
     """
-    _, command_success = send_command(
-        ser,
-        intra_frame_length=int(4).to_bytes(
-            2, byteorder="little", signed=False),
-        command_word=bytes.fromhex("A4 00"),
-        command_value=bytes.fromhex(
-            "01 00") if bluetooth_on else bytes.fromhex("00 00")
+    _, command_success = send_command_frame(
+        ser, BLUETOOTH_ON_FRAME if bluetooth_on else BLUETOOTH_OFF_FRAME
     )
 
     if command_success:
@@ -353,13 +426,7 @@ def get_mac_address(ser: serial.Serial) -> str:
     Returns:
     - mac_address (str): the MAC address of the radar
     """
-    response, command_success = send_command(
-        ser,
-        intra_frame_length=int(4).to_bytes(
-            2, byteorder="little", signed=False),
-        command_word=bytes.fromhex("A5 00"),
-        command_value=bytes.fromhex("01 00")
-    )
+    response, command_success = send_command_frame(ser, GET_MAC_ADDRESS_FRAME)
     if not command_success:
         print("Get MAC address failed")
         return None
@@ -383,54 +450,17 @@ def query_zone_filtering(ser: serial.Serial) -> tuple[13]:
         [5-8] region 2 diagonal vertices coordinates (int): x1, y1, x2, y2
         [9-12] region 3 diagonal vertices coordinates (int): x1, y1, x2, y2
     """
-    response, command_success = send_command(
-        ser,
-        intra_frame_length=int(2).to_bytes(
-            2, byteorder="little", signed=False),
-        command_word=bytes.fromhex("C1 00"),
-        command_value=BYTES_FROM_HEX_EMPTY
-    )
+    response, command_success = send_command_frame(ser, QUERY_ZONE_FILTERING_FRAME)
 
-    if not command_success:
+    if not command_success or len(response) < _ZONE_FILTERING_LENGTH:
         print("Query zone filtering mode failed")
         return None
 
-    zone_filtering_mode = int.from_bytes(
-        response[10:12], byteorder="little", signed=True
-    )
+    zone_filtering = _ZONE_FILTERING_STRUCT.unpack_from(response, 10)
 
-    print(f"Zone filtering mode: {zone_filtering_mode}")
+    print(f"Zone filtering mode: {zone_filtering[0]}")
 
-    return (
-        zone_filtering_mode,
-        # Region 1
-        # region1_x1
-        int.from_bytes(response[12:14], byteorder="little", signed=True),
-        # region1_y1
-        int.from_bytes(response[14:16], byteorder="little", signed=True),
-        # region1_x2
-        int.from_bytes(response[16:18], byteorder="little", signed=True),
-        # region1_y2
-        int.from_bytes(response[18:20], byteorder="little", signed=True),
-        # Region 2
-        # region2_x1
-        int.from_bytes(response[20:22], byteorder="little", signed=True),
-        # region2_y1
-        int.from_bytes(response[22:24], byteorder="little", signed=True),
-        # region2_x2
-        int.from_bytes(response[24:26], byteorder="little", signed=True),
-        # region2_y2
-        int.from_bytes(response[26:28], byteorder="little", signed=True),
-        # Region 3
-        # region3_x1
-        int.from_bytes(response[28:30], byteorder="little", signed=True),
-        # region3_y1
-        int.from_bytes(response[30:32], byteorder="little", signed=True),
-        # region3_x2
-        int.from_bytes(response[32:34], byteorder="little", signed=True),
-        # region3_y2
-        int.from_bytes(response[34:36], byteorder="little", signed=True),
-    )
+    return zone_filtering
 
 
 def set_zone_filtering(
@@ -473,20 +503,16 @@ def set_zone_filtering(
     """
     _, command_success = send_command(
         ser,
-        intra_frame_length=int(26).to_bytes(
-            2, byteorder="little", signed=False),
-        command_word=bytes.fromhex("C2 00"),
-        command_value=bytes.fromhex(
-            f"{zone_filtering_mode:04x} "
+        intra_frame_length=INTRA_FRAME_LENGTH_26,
+        command_word=SET_ZONE_FILTERING_COMMAND,
+        command_value=_ZONE_FILTERING_STRUCT.pack(
+            zone_filtering_mode,
             # Region 1
-            f"{region1_x1:04x} {region1_y1:04x} "
-            f"{region1_x2:04x} {region1_y2:04x} "
+            region1_x1, region1_y1, region1_x2, region1_y2,
             # Region 2
-            f"{region2_x1:04x} {region2_y1:04x} "
-            f"{region2_x2:04x} {region2_y2:04x} "
+            region2_x1, region2_y1, region2_x2, region2_y2,
             # Region 3
-            f"{region3_x1:04x} {region3_y1:04x} "
-            f"{region3_x2:04x} {region3_y2:04x}"
+            region3_x1, region3_y1, region3_x2, region3_y2,
         )
     )
 
@@ -499,12 +525,186 @@ def set_zone_filtering(
     return command_success
 
 
-def read_radar_data(serial_port_line: bytes) -> tuple[12]:
+@contextmanager
+def _chunk_reader(ser: serial.Serial) -> Iterator[Callable[[memoryview], int]]:
+    """
+    Provide a function reading the bytes available on the serial port
+
+    On POSIX, the file descriptor of the port is read directly, which skips
+    pyserial's pure Python read loop. The terminal is also set up so that
+    each read blocks until a whole report frame is received (VMIN) or the
+    line stays idle for 0.1 s (VTIME), its settings are restored on exit.
+    Elsewhere (e.g., on Windows), the port has no file descriptor and
+    pyserial is used instead.
+
+    Parameters:
+    - ser (serial.Serial): the serial port object
+
+    Yields:
+    - read_into (Callable[[memoryview], int]): a function reading into the
+    given buffer and returning the number of bytes read, 0 if the port
+    timed out
+    """
+    try:
+        fd = ser.fileno()
+
+    except io.UnsupportedOperation:
+        def read_into_serial(buffer: memoryview) -> int:
+            size = min(len(buffer), ser.in_waiting or REPORT_FRAME_LENGTH)
+            return ser.readinto(buffer[:size])
+
+        yield read_into_serial
+        return
+
+    def read_into(buffer: memoryview) -> int:
+        ready, _, _ = select.select([fd], [], [], ser.timeout)
+
+        if not ready:
+            return 0
+
+        size = os.readv(fd, (buffer,))
+
+        if not size:
+            raise serial.SerialException(
+                "The serial port is ready to read but returned no data "
+                "(device disconnected?)"
+            )
+
+        return size
+
+    was_blocking = os.get_blocking(fd)
+    attributes = termios.tcgetattr(fd)
+
+    frame_attributes = termios.tcgetattr(fd)
+    frame_attributes[6][termios.VMIN] = REPORT_FRAME_LENGTH
+    frame_attributes[6][termios.VTIME] = 1  # in tenths of a second
+
+    # VMIN and VTIME only apply to blocking reads
+    os.set_blocking(fd, True)
+    termios.tcsetattr(fd, termios.TCSANOW, frame_attributes)
+
+    try:
+        yield read_into
+
+    finally:
+        if ser.is_open:
+            termios.tcsetattr(fd, termios.TCSANOW, attributes)
+            os.set_blocking(fd, was_blocking)
+
+        else:
+            warnings.warn(
+                "The serial port was closed before its settings could be "
+                "restored (close the port after leaving report_frames)",
+                RuntimeWarning,
+            )
+
+
+@contextmanager
+def report_frames(ser: serial.Serial) -> Iterator[Iterator[memoryview]]:
+    """
+    Set up the serial port to read the report frames (see docs 2.3)
+
+    The port settings changed to read the frames are restored on exit, so
+    use it inside the block of the opened serial port:
+
+        with serial.Serial(port, baudrate, timeout=1) as ser:
+            with report_frames(ser) as frames:
+                for serial_port_line in frames:
+                    ...
+
+    The port is read in bulk until a frame header is found. Once the reads
+    are aligned on the frames, each frame is read in place into the same
+    preallocated buffer, so a yielded frame is overwritten by the next one
+    (use bytes(serial_port_line) to keep it).
+
+    Parameters:
+    - ser (serial.Serial): the serial port object
+
+    Yields:
+    - frames (Iterator[memoryview]): the report frames, header and tail
+    included
+    """
+    with _chunk_reader(ser) as read_into:
+        frames = _split_report_frames(read_into)
+
+        try:
+            yield frames
+
+        finally:
+            frames.close()
+
+
+def _split_report_frames(
+    read_into: Callable[[memoryview], int]
+) -> Iterator[memoryview]:
+    """Yield the report frames found in the bytes read with read_into."""
+    frame = bytearray(REPORT_FRAME_LENGTH)
+    frame_view = memoryview(frame)
+    chunk_view = memoryview(bytearray(READ_CHUNK_SIZE))
+
+    # Bytes read while looking for a frame header
+    buffer = bytearray()
+    synchronized = False
+
+    while True:
+        if synchronized:
+            size = read_into(frame_view)
+
+            while size < REPORT_FRAME_LENGTH:
+                size += read_into(frame_view[size:])
+
+            if (
+                frame.startswith(REPORT_HEADER)
+                and frame.endswith(REPORT_TAIL)
+            ):
+                yield frame_view
+                continue
+
+            # Synchronization lost, look for a header in the frame
+            buffer += frame
+            synchronized = False
+
+        buffer += chunk_view[:read_into(chunk_view)]
+
+        while True:
+            frame_start = buffer.find(REPORT_HEADER)
+
+            if frame_start == -1:
+                # Keep the bytes that could be the beginning of a header
+                del buffer[:1 - len(REPORT_HEADER)]
+                break
+
+            del buffer[:frame_start]
+
+            if len(buffer) < REPORT_FRAME_LENGTH:
+                break
+
+            if not buffer.endswith(REPORT_TAIL, 0, REPORT_FRAME_LENGTH):
+                # Not an actual frame, look for the next header
+                del buffer[:1]
+                continue
+
+            frame[:] = buffer[:REPORT_FRAME_LENGTH]
+            del buffer[:REPORT_FRAME_LENGTH]
+
+            # The next read starts with the next frame
+            synchronized = not buffer
+
+            yield frame_view
+
+
+def _fix_sign(value: int) -> int:
+    """Convert a sign-magnitude 16-bit value read from the radar to an int."""
+    # The sign bit selects a factor of -1 (set) or 1 (cleared)
+    return (1 - 2 * (value >> SIGN_SHIFT)) * (value & MAGNITUDE_MASK)
+
+
+def read_radar_data(serial_port_line: bytes | memoryview) -> tuple[12]:
     """
     Read the basic mode data from the serial port line (see docs 2.3)
 
     Parameters:
-    - serial_port_line (bytes): the serial port line
+    - serial_port_line (bytes | memoryview): the serial port line
 
     Returns:
     - radar_data (tuple[12]): the radar data
@@ -512,46 +712,38 @@ def read_radar_data(serial_port_line: bytes) -> tuple[12]:
         - [4-7] x, y, speed, distance_resolution of target 2
         - [8-11] x, y, speed, distance_resolution of target 3
     """
-    # Check if the frame header and tail are present
-    if REPORT_HEADER not in serial_port_line:
-        print("Serial port line corrupted - report header missing")
+    if len(serial_port_line) != REPORT_FRAME_LENGTH:
+        print("Serial port line corrupted - not 30 bytes long")
         return None
 
-    if REPORT_TAIL not in serial_port_line:
-        print("Serial port line corrupted - report tail missing")
+    # Check if the frame header and tail are at their expected positions
+    # (compared by slices, which also works with a memoryview)
+    if serial_port_line[:4] != REPORT_HEADER:
+        print("Serial port line corrupted - report header missing")
         return None
 
-    if len(serial_port_line) != 30:
-        print("Serial port line corrupted - not 30 bytes long")
+    if serial_port_line[28:] != REPORT_TAIL:
+        print("Serial port line corrupted - report tail missing")
         return None
 
     # Interpret the target data
-    all_targets_bytes = [
-        # target1_bytes
-        serial_port_line[4:12],
-        # target2_bytes
-        serial_port_line[12:20],
-        # target3_bytes
-        serial_port_line[20:28],
-    ]
-
-    all_targets_data = []
-
-    for target_bytes in all_targets_bytes:
-        x = int.from_bytes(target_bytes[0:2], byteorder="little", signed=True)
-        y = int.from_bytes(target_bytes[2:4], byteorder="little", signed=True)
-        speed = int.from_bytes(
-            target_bytes[4:6], byteorder="little", signed=True)
-        distance_resolution = int.from_bytes(
-            target_bytes[6:8], byteorder="little", signed=False
-        )
-
-        # Subtract 2^15 depending if negative or positive
-        x = x if x >= 0 else - (2 ** 15) - x
-        y = y if y >= 0 else - (2 ** 15) - y
-        speed = speed if speed >= 0 else - (2 ** 15) - speed
+    (
+        target1_x, target1_y, target1_speed, target1_distance_resolution,
+        target2_x, target2_y, target2_speed, target2_distance_resolution,
+        target3_x, target3_y, target3_speed, target3_distance_resolution,
+    ) = _RADAR_DATA_STRUCT.unpack_from(serial_port_line, 4)
 
-        # Append target data to the list and flatten
-        all_targets_data.extend([x, y, speed, distance_resolution])
-
-    return tuple(all_targets_data)
+    return (
+        _fix_sign(target1_x),
+        _fix_sign(target1_y),
+        _fix_sign(target1_speed),
+        target1_distance_resolution,
+        _fix_sign(target2_x),
+        _fix_sign(target2_y),
+        _fix_sign(target2_speed),
+        target2_distance_resolution,
+        _fix_sign(target3_x),
+        _fix_sign(target3_y),
+        _fix_sign(target3_speed),
+        target3_distance_resolution,
+    )